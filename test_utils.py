@@ -0,0 +1,111 @@
+# coding: utf-8
+
+import os
+from os import path
+
+import pandas as pd
+import pytest
+
+import utils
+
+HEADER = 'DATE;ACTIVITY TYPE;BUY/SELL;QUANTITY;ASSET;PRICE PER UNIT;DEBIT CURRENCY;CREDIT CURRENCY'
+JANUARY = [
+    '03/01/2024;INVEST_ORDER_EXECUTED;BUY;1.5;ETH;2000.0;CHF;',
+    '15/01/2024;INVEST_ORDER_EXECUTED;BUY;2;SOL;90.0;CHF;',
+]
+FEBRUARY = [
+    '02/02/2024;INVEST_ORDER_EXECUTED;SELL;0.5;ETH;2100.0;;CHF',
+]
+
+
+def write_export(folder, name, rows):
+    with open(path.join(folder, name), 'w') as export_file:
+        export_file.write('\n'.join([HEADER] + rows) + '\n')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    utils.clear_export_cache()
+    yield
+    utils.clear_export_cache()
+
+
+def test_overlapping_exports_are_deduplicated(tmp_path):
+    write_export(tmp_path, 'A.CSV', JANUARY)
+    write_export(tmp_path, 'B.CSV', JANUARY[1:] + FEBRUARY)
+    data = utils.read_data_export(str(tmp_path))
+    assert len(data) == 3
+    assert data['QUANTITY'].tolist() == [1.5, 2.0, 0.5]
+    assert data['DATE'].is_monotonic_increasing
+    assert 'ACTIVITY_TYPE' in data.columns
+
+
+def test_identical_orders_within_a_file_are_kept(tmp_path):
+    write_export(tmp_path, 'A.CSV', JANUARY + JANUARY[1:])
+    write_export(tmp_path, 'B.CSV', JANUARY[1:] + FEBRUARY)
+    data = utils.read_data_export(str(tmp_path))
+    assert (data['ASSET'] == 'SOL').sum() == 2
+    assert len(data) == 4
+
+
+def test_unchanged_folder_is_not_parsed_again(tmp_path, monkeypatch):
+    write_export(tmp_path, 'A.CSV', JANUARY)
+    first = utils.read_data_export(str(tmp_path))
+
+    def read_csv(*args, **kwargs):
+        raise AssertionError('export parsed again')
+
+    monkeypatch.setattr(pd, 'read_csv', read_csv)
+    second = utils.read_data_export(str(tmp_path))
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_removed_file_removes_its_rows(tmp_path):
+    write_export(tmp_path, 'A.CSV', JANUARY)
+    write_export(tmp_path, 'B.CSV', FEBRUARY)
+    assert len(utils.read_data_export(str(tmp_path))) == 3
+    os.remove(path.join(tmp_path, 'B.CSV'))
+    data = utils.read_data_export(str(tmp_path))
+    assert data['BUY_SELL'].tolist() == ['BUY', 'BUY']
+
+
+def test_cleared_cache_parses_again(tmp_path, monkeypatch):
+    write_export(tmp_path, 'A.CSV', JANUARY)
+    first = utils.read_data_export(str(tmp_path))
+    utils.clear_export_cache()
+    calls = []
+    read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs)
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, 'read_csv', counting_read_csv)
+    second = utils.read_data_export(str(tmp_path))
+    assert calls
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_returned_data_does_not_alter_the_cache(tmp_path):
+    write_export(tmp_path, 'A.CSV', JANUARY)
+    first = utils.read_data_export(str(tmp_path))
+    first.loc[0, 'QUANTITY'] = 100.0
+    second = utils.read_data_export(str(tmp_path))
+    assert second.loc[0, 'QUANTITY'] == 1.5
+
+
+def test_export_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, 'EXPORT_CACHE_SIZE', 1)
+    write_export(tmp_path, 'A.CSV', JANUARY)
+    utils.read_data_export(str(tmp_path))
+    write_export(tmp_path, 'A.CSV', FEBRUARY)
+    data = utils.read_data_export(str(tmp_path))
+    assert len(utils._PARSED_EXPORTS) == 1
+    assert data['BUY_SELL'].tolist() == ['SELL']
+
+
+def test_malformed_date_is_kept_as_text(tmp_path):
+    write_export(tmp_path, 'A.CSV', JANUARY + ['2024-02-02;INVEST_ORDER_EXECUTED;BUY;1;ETH;2000.0;CHF;'])
+    data = utils.read_data_export(str(tmp_path))
+    assert len(data) == 3
+    assert data['DATE'].dtype == object
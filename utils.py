@@ -1,37 +1,110 @@
 # coding: utf-8
 
+import hashlib
+from collections import OrderedDict
 from glob import glob
+from io import BytesIO
 from os import path
-from typing import List, Optional, Union, Dict
+from typing import List, Optional, Tuple, Union, Dict
 from datetime import datetime
 import pytz
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 RATE_DATA_PATH = './data'
+EXPORT_CACHE_SIZE = 64
+
+# Parsed exports and their row hashes, keyed by file digest (least recently used first)
+_PARSED_EXPORTS: OrderedDict[str, Tuple[pd.DataFrame, np.ndarray]] = OrderedDict()
+
+def _file_digest(raw: bytes) -> str:
+    """
+    Compute the content digest of a data export file
+    Args:
+        - raw (bytes): the raw content of the file
+    Return:
+        a hexadecimal string identifying the file content
+    """
+    return hashlib.sha256(raw).hexdigest()
+
+def _row_hashes(raw: bytes) -> np.ndarray:
+    """
+    Compute a content hash for every transaction of a data export file
+    Args:
+        - raw (bytes): the raw content of the file
+    Return:
+        a numpy.ndarray of uint64 hashes, one per row
+    """
+    # Rows are hashed on their raw text so that dtype inference, which may differ
+    # between exports (e.g. an all-empty column), does not alter the hashes
+    text_data = pd.read_csv(BytesIO(raw), sep=';', dtype=str)
+    hashes = pd.util.hash_pandas_object(text_data, index=False)
+    # Identical transactions within a single export are legitimate (e.g. two equal
+    # orders on the same day), so each one is keyed by its occurrence number as well
+    occurrences = hashes.groupby(hashes).cumcount()
+    keys = pd.DataFrame({'HASH': hashes.values, 'OCCURRENCE': occurrences.values})
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+
+def _parse_export(raw: bytes) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Parse a data export file along with its row hashes, caching the result by content
+    Args:
+        - raw (bytes): the raw content of the file
+    Return:
+        a tuple of the parsed pd.DataFrame and its row hashes
+    """
+    digest = _file_digest(raw)
+    if digest in _PARSED_EXPORTS:
+        _PARSED_EXPORTS.move_to_end(digest)
+        return _PARSED_EXPORTS[digest]
+
+    data = pd.read_csv(
+        BytesIO(raw),
+        sep=';',
+        parse_dates=['DATE'],
+        date_format='%d/%m/%Y'
+    )
+    data.columns = data.columns.str.replace(' ', '_')
+    data.columns = data.columns.str.replace('/', '_')
+    _PARSED_EXPORTS[digest] = (data, _row_hashes(raw))
+    if len(_PARSED_EXPORTS) > EXPORT_CACHE_SIZE:
+        _PARSED_EXPORTS.popitem(last=False)
+    return _PARSED_EXPORTS[digest]
+
+def clear_export_cache() -> None:
+    """
+    Forget every data export parsed so far, forcing them to be read again
+    Return:
+        None
+    """
+    _PARSED_EXPORTS.clear()
 
 def read_data_export(folder: str) -> pd.DataFrame:
     """
-    Read data export from CSV files in a single DataFrame sorted by date
+    Read data export from CSV files in a single DataFrame sorted by date.
+    Transactions are de-duplicated across overlapping exports using per-row content
+    hashes. Parsed files are cached in memory by content, so that re-reading an
+    unchanged export within the same process does not parse it again.
     Args:
         - folder (str): specifies data files location
     Return:
         a pandas.DataFrame
     """
-    exported_files: List = glob(path.join(folder, '*.CSV'))
+    exported_files: List = sorted(glob(path.join(folder, '*.CSV')))
     data_files: List = []
+    hash_files: List = []
     for file_path in exported_files:
-        data_files += [pd.read_csv(
-            file_path,
-            sep=';',
-            parse_dates=['DATE'],
-            date_format='%d/%m/%Y'
-        )]
-    data: pd.DataFrame = pd.concat(data_files)
-    data.sort_values(by='DATE', inplace=True)
-    data.columns = data.columns.str.replace(' ', '_')
-    data.columns = data.columns.str.replace('/', '_')
+        with open(file_path, 'rb') as export_file:
+            file_data, file_hashes = _parse_export(export_file.read())
+        data_files += [file_data]
+        hash_files += [file_hashes]
+
+    data: pd.DataFrame = pd.concat(data_files, ignore_index=True)
+    # Single hash table pass, keeping the first occurrence of each transaction
+    duplicated = pd.Index(np.concatenate(hash_files)).duplicated()
+    data = data[~duplicated].sort_values(by='DATE', kind='stable')
     data.reset_index(drop=True, inplace=True)
     return data
 